@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from typing import Any, Optional
+import numpy as np
+
+class SemanticCache:
+    """LRU cache of responses keyed by embedding similarity of their inputs.
+
+    Each entry belongs to a group, and a lookup only matches entries in the
+    same group - callers use it to require an exact match on the parts of
+    the input that similarity alone must not blur.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 256):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[str, np.ndarray, Any]]" = OrderedDict()
+        self._keys: list[str] = []
+        self._groups: Optional[np.ndarray] = None
+        self._matrix: Optional[np.ndarray] = None
+
+    def _rebuild(self):
+        """Restack cached vectors so lookups are a single matmul"""
+        self._keys = list(self._entries.keys())
+        if not self._entries:
+            self._groups = self._matrix = None
+            return
+        self._groups = np.array([group for group, _, _ in self._entries.values()], dtype=object)
+        self._matrix = np.stack([vector for _, vector, _ in self._entries.values()])
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, group: str, embedding: list[float]) -> Optional[Any]:
+        """Return the most similar cached value in the group, if above threshold"""
+        if self._matrix is None:
+            return None
+
+        scores = np.matmul(self._matrix, self._normalize(embedding))
+        scores[self._groups != group] = -np.inf
+        best = int(np.argmax(scores))
+        if scores[best] <= self.threshold:
+            return None
+
+        key = self._keys[best]
+        self._entries.move_to_end(key)
+        return self._entries[key][2]
+
+    def put(self, key: str, group: str, embedding: list[float], value: Any):
+        """Store a value, evicting the least recently used entry when full"""
+        self._entries[key] = (group, self._normalize(embedding), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._rebuild()
+
+    def discard(self, key: str):
+        """Remove an entry, e.g. when its project is deleted"""
+        if self._entries.pop(key, None) is not None:
+            self._rebuild()
@@ -1,22 +1,51 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from typing import TypedDict, List
+from typing import Awaitable, Callable, TypedDict, Dict, List, Optional, Tuple
 from datetime import datetime
+from contextlib import asynccontextmanager
 import os
+import tempfile
+import asyncio
+import hashlib
+import orjson
 from langgraph.graph import END, StateGraph
-from langchain_openai import ChatOpenAI
+from langgraph.checkpoint.aiosqlite import AsyncSqliteSaver
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langchain_core.messages import SystemMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from .cache import SemanticCache
+from .middleware import FastCORS
 from .services import ProjectService, ProjectInput, Project, projects_store
 
-app = FastAPI(title="Project Management System", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the workflow checkpointer for the app's lifetime and close it on shutdown"""
+    global checkpointer, app_workflow, planning_workflow
+    async with AsyncSqliteSaver.from_conn_string(WORKFLOW_DB) as saver:
+        checkpointer = saver
+        app_workflow = workflow.compile(checkpointer=saver)
+        planning_workflow = workflow.compile(
+            checkpointer=saver, interrupt_before=["html_generator"]
+        )
+        yield
+        checkpointer = None
+        app_workflow = None
+        planning_workflow = None
+
+app = FastAPI(
+    title="Project Management System",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 
 # CORS middleware
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[os.getenv("FRONTEND_URL", "http://localhost:3000")],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    FastCORS,
+    origin=os.getenv("FRONTEND_URL", "http://localhost:3000"),
+    expose_headers=["X-Project-Id"],
 )
 
 # Response models
@@ -35,6 +64,24 @@ class ProjectListResponse(BaseModel):
     industry: str
     created_at: datetime
 
+class BatchItemResponse(BaseModel):
+    project: Optional[ProjectResponse] = None
+    error: Optional[str] = None
+    project_id: Optional[str] = None
+
+class WorkflowInterrupted(Exception):
+    """A workflow run failed after its project was created; it can be resumed"""
+    def __init__(self, project_id: str, error: Exception):
+        super().__init__(str(error))
+        self.project_id = project_id
+        self.error = error
+
+# Structured output of the combined planning call
+class PlanBundle(BaseModel):
+    plan: str
+    schedule: str
+    review: str
+
 # LangGraph State
 class ProjectState(TypedDict):
     input: str
@@ -48,71 +95,34 @@ api_key = os.getenv("OPENAI_API_KEY")
 if not api_key:
     raise ValueError("OPENAI_API_KEY environment variable is required")
 
-llm = ChatOpenAI(model="gpt-4-turbo", api_key=api_key)
+# Planning output is structured Markdown, which a small model handles well;
+# the larger model is reserved for the long-form HTML page. OpenAI's prompt
+# cache is per model, so each chain keeps its own system prompt rather than
+# sharing a prefix across the two calls.
+llm_fast = ChatOpenAI(model=os.getenv("OPENAI_FAST_MODEL", "gpt-4o-mini"), api_key=api_key)
+llm_strong = ChatOpenAI(model=os.getenv("OPENAI_STRONG_MODEL", "gpt-4o"), api_key=api_key)
+bundle_llm = llm_fast.bind(response_format={"type": "json_object"})
+
+# Semantic cache of generated plans, keyed on the embedded project input
+embeddings = OpenAIEmbeddings(model="text-embedding-3-small", api_key=api_key)
+response_cache = SemanticCache(
+    threshold=float(os.getenv("CACHE_SIMILARITY_THRESHOLD", 0.95)),
+    max_entries=int(os.getenv("CACHE_MAX_ENTRIES", 256))
+)
 
-# Agent functions
-def planner_agent(state: ProjectState) -> ProjectState:
-    project_info = state["input"]
-    prompt = f"""
-As a Project Planner, your task is to break down the following project description into major phases and detailed tasks. Be very specific and ensure that the output is a clear and concise Markdown list of the phases and their corresponding tasks.
+# Agent prompts - static instructions go first so OpenAI's prompt cache can
+# reuse the prefix across requests; dynamic project data is sent last.
+BUNDLE_SYSTEM = """
+You are a Project Planner, Scheduler and Reviewer. Based on the project description, produce three sections and return them as a JSON object with the keys "plan", "schedule" and "review". Each value must be a Markdown string.
 
-Project Description:
-{project_info}
+1. **plan:** Break down the project into major phases and detailed tasks. Be very specific and ensure that the output is a clear and concise Markdown list of the phases and their corresponding tasks.
+2. **schedule:** Based on the plan, assign realistic timelines (in weeks) for each task. Assign appropriate team members *only* from the "Team Members" list provided in the project description. Do not create or use any team member names not listed. Assign a project leader *only* from the provided team members, and indicate dependencies where appropriate. Output as a Markdown table with columns: Task | Duration (weeks) | Team Member | Dependencies
+3. **review:** Review the schedule for completeness, any missing dependencies or tasks, potential bottlenecks, unrealistic timelines, and issues with team member assignments based on the project description. Output suggestions as a Markdown list. If no issues are found that would prevent successful project completion, write: "No significant issues found."
 
-Provide the output as a Markdown list.
+Output only the JSON object.
 """
-    response = llm.invoke(prompt).content
-    print("\nPlanner Agent\n")
-    print("\nAgent Output: ", response)
-    state["plan"] = response
-    return state
-
-def scheduler_agent(state: ProjectState) -> ProjectState:
-    plan = state["plan"]
-    project_info = state["input"]
-    prompt = f"""
-You are a Project Scheduler. Based on the provided plan and the project description, assign realistic timelines (in weeks) for each task. Assign appropriate team members *only* from the "Team Members" list provided in the project description. Do not create or use any team member names not listed. Assign a project leader *only* from the provided team members, and indicate dependencies where appropriate.
-
-Project Plan:
-{plan}
-
-Project Description:
-{project_info}
 
-Output as a Markdown table with columns: Task | Duration (weeks) | Team Member | Dependencies
-"""
-    response = llm.invoke(prompt).content
-    print("\nSchedule Agent\n")
-    print("\nAgent Output: ", response)
-    state["schedule"] = response
-    return state
-
-def reviewer_agent(state: ProjectState) -> ProjectState:
-    schedule = state["schedule"]
-    project_info = state["input"]
-    prompt = f"""
-You are a Project Reviewer. Review this schedule for completeness, any missing dependencies or tasks, potential bottlenecks, unrealistic timelines, and issues with team member assignments based on the project description.
-
-Here is the schedule to review:
-{schedule}
-
-Project Description:
-{project_info}
-
-Output suggestions as a Markdown list. If no issues are found that would prevent successful project completion, write: "No significant issues found."
-"""
-    response = llm.invoke(prompt).content
-    print("\nReviewer Agent\n")
-    print("\nAgent Output: ", response)
-    state["review"] = response
-    return state
-
-def html_agent(state: ProjectState) -> ProjectState:
-    plan = state["plan"]
-    schedule = state["schedule"]
-    review = state["review"]
-    project_info = state["input"]
-    prompt = f"""
+HTML_SYSTEM = """
 You are an HTML Generator. Based on the project plan, schedule, and review, create a single, professional-looking HTML page that summarizes all the information.
 
 IMPORTANT: Convert ALL markdown content to proper HTML format:
@@ -129,8 +139,28 @@ Include the following sections in order:
 
 Use inline CSS for basic styling (borders for tables, padding, margins). Ensure the output is a complete HTML document with DOCTYPE, html, head, and body tags.
 
-Project Description:
-{project_info}
+Make sure the HTML table includes:
+- Table headers (Task, Duration, Team Member, Dependencies)
+- ALL task rows from the markdown table
+- Proper table styling with borders and padding
+- Responsive layout
+
+Output the complete HTML code.
+"""
+
+# Prompt templates and chains, built once at import and reused per request.
+# System prompts are passed as messages, so they are never parsed as templates.
+BUNDLE_TMPL = ChatPromptTemplate.from_messages([
+    SystemMessage(content=BUNDLE_SYSTEM),
+    ("human", "PROJECT CONTEXT:\n{input}"),
+])
+
+HTML_TMPL = ChatPromptTemplate.from_messages([
+    SystemMessage(content=HTML_SYSTEM),
+    ("human", """PROJECT CONTEXT:
+{input}
+
+---
 
 Project Plan (Markdown to convert to HTML):
 {plan}
@@ -140,49 +170,58 @@ Project Schedule (Markdown table to convert to HTML table - INCLUDE ALL ROWS):
 
 Review Feedback (Markdown to convert to HTML):
 {review}
+"""),
+])
 
-Make sure the HTML table includes:
-- Table headers (Task, Duration, Team Member, Dependencies)
-- ALL task rows from the markdown table
-- Proper table styling with borders and padding
-- Responsive layout
+bundle_chain = BUNDLE_TMPL | bundle_llm | StrOutputParser() | PlanBundle.model_validate_json
+html_chain = HTML_TMPL | llm_strong | StrOutputParser()
 
-Output the complete HTML code.
-"""
-    response = llm.invoke(prompt).content
-    print("\nHTML Generator Agent\n")
-    print("\nAgent Output: ", response)
-    state["html_output"] = response
-    return state
+# Agent functions
+async def bundle_agent(state: ProjectState) -> dict:
+    bundle = await bundle_chain.ainvoke({"input": state["input"]})
+    return bundle.model_dump()
+
+async def html_agent(state: ProjectState) -> dict:
+    return {"html_output": await html_chain.ainvoke(state)}
 
 # Create workflow
 workflow = StateGraph(ProjectState)
-workflow.add_node("planner", planner_agent)
-workflow.add_node("scheduler", scheduler_agent)
-workflow.add_node("reviewer", reviewer_agent)
+workflow.add_node("bundle", bundle_agent)
 workflow.add_node("html_generator", html_agent)
 
-workflow.set_entry_point("planner")
-workflow.add_edge("planner", "scheduler")
-workflow.add_edge("scheduler", "reviewer")
-workflow.add_edge("reviewer", "html_generator")
+workflow.set_entry_point("bundle")
+workflow.add_edge("bundle", "html_generator")
 workflow.add_edge("html_generator", END)
 
-app_workflow = workflow.compile()
-
-# API Routes
-@app.get("/")
-async def root():
-    return {"message": "Project Management System API with In-Memory Storage"}
-
-@app.post("/generate-project-plan", response_model=ProjectResponse)
-async def generate_project_plan(project_input: ProjectInput):
-    try:
-        # Create project in memory using service
-        project = ProjectService.create_project(project_input)
-        
-        # Format the input for the LangGraph workflow
-        formatted_input = f"""
+# Checkpoint every stage so a failed run can resume from the failed node;
+# a run's checkpoints are deleted once its results are stored.
+# The temp dir default keeps this writable on read-only deploys like Vercel.
+# These are set by the lifespan handler while the app is running;
+# planning_workflow stops before the HTML stage so it can be streamed.
+WORKFLOW_DB = os.getenv("WORKFLOW_DB", os.path.join(tempfile.gettempdir(), "workflow.db"))
+checkpointer: Optional[AsyncSqliteSaver] = None
+app_workflow = None
+planning_workflow = None
+
+# Serialized /projects listing, tagged with the store revision it was built from
+_list_cache: Optional[Tuple[int, bytes]] = None
+
+# Generations currently running, keyed by a hash of their formatted input,
+# or by project id for runs on an existing project (resumes and streams)
+_inflight: Dict[str, asyncio.Future] = {}
+
+# Maximum number of workflow runs in flight at once
+OPENAI_CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", 4))
+workflow_semaphore = asyncio.Semaphore(OPENAI_CONCURRENCY)
+
+# Maximum number of projects accepted in one batch request
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", 20))
+
+def format_project_input(project_input: ProjectInput) -> str:
+    """Format a project input as the Markdown description fed to the workflow"""
+    team_members = "\n".join(f"- {member}" for member in project_input.team_members)
+    requirements = "\n".join(f"- {req}" for req in project_input.requirements)
+    return f"""
 **Project Type:** {project_input.project_type}
 
 **Project Objectives:** {project_input.objectives}
@@ -190,50 +229,313 @@ async def generate_project_plan(project_input: ProjectInput):
 **Industry:** {project_input.industry}
 
 **Team Members:**
-{chr(10).join([f"- {member}" for member in project_input.team_members])}
+{team_members}
 
 **Project Requirements:**
-{chr(10).join([f"- {req}" for req in project_input.requirements])}
+{requirements}
 """
+
+def cache_group(team_members: List[str]) -> str:
+    """Semantic cache group - schedules name team members, so the roster must match exactly"""
+    return "\n".join(team_members)
+
+def claim_inflight(key: str):
+    """Register a run so identical requests wait for it instead of repeating it"""
+    _inflight[key] = asyncio.get_running_loop().create_future()
+
+def release_inflight(key: str, result: Optional[ProjectResponse] = None, error: Optional[BaseException] = None):
+    """Unregister a run and hand its outcome to any waiters; no-op if already released"""
+    future = _inflight.pop(key, None)
+    if future is None:
+        return
+    if error is None:
+        future.set_result(result)
+    elif not isinstance(error, Exception):
+        future.cancel()
+    else:
+        future.set_exception(error)
+        # Mark the exception retrieved in case no other request is waiting
+        future.exception()
+
+async def share_inflight(key: str, run: Callable[[], Awaitable[ProjectResponse]]) -> ProjectResponse:
+    """Start a run under the given key, or wait for the one already in flight"""
+    # The shield keeps this waiter's own cancellation from cancelling the shared run
+    if key in _inflight:
+        shared = _inflight[key]
+        try:
+            return await asyncio.shield(shared)
+        except asyncio.CancelledError:
+            if shared.cancelled():
+                raise RuntimeError("Identical in-flight generation was cancelled")
+            raise
+    
+    claim_inflight(key)
+    try:
+        response = await run()
+    except BaseException as e:
+        release_inflight(key, error=e)
+        raise
+    release_inflight(key, result=response)
+    return response
+
+async def run_project_generation(project_input: ProjectInput) -> ProjectResponse:
+    """Generate the plan for a project input, sharing any identical run in flight"""
+    formatted_input = format_project_input(project_input)
+    key = hashlib.sha256(formatted_input.encode()).hexdigest()
+    return await share_inflight(key, lambda: generate_project(project_input, formatted_input))
+
+async def generate_project(project_input: ProjectInput, formatted_input: str) -> ProjectResponse:
+    """Generate, store and cache the plan for a single project input"""
+    # Return a stored result for the same or a near-duplicate project
+    group = cache_group(project_input.team_members)
+    embedding = await embeddings.aembed_query(formatted_input)
+    cached = response_cache.get(group, embedding)
+    if cached is not None:
+        return cached
+    
+    # Create project in memory using service
+    project = ProjectService.create_project(project_input)
+    
+    async def run() -> ProjectResponse:
+        output = await run_workflow(app_workflow, {"input": formatted_input}, project.id)
+        return await complete_run(project.id, output, group, embedding)
+    
+    # The project is listed as soon as it exists - claim its id as well, so a
+    # resume sent while this run is still going waits for it
+    return await share_inflight(project.id, run)
+
+async def resume_project_generation(project_id: str) -> ProjectResponse:
+    """Resume an interrupted workflow from its last completed stage"""
+    project = ProjectService.get_project_by_id(project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    snapshot = await app_workflow.aget_state(workflow_config(project_id))
+    if not snapshot.next:
+        raise HTTPException(status_code=409, detail="No interrupted workflow to resume")
+    
+    group = cache_group(project.team_members)
+    embedding = await embeddings.aembed_query(snapshot.values["input"])
+    output = await run_workflow(app_workflow, None, project_id)
+    return await complete_run(project_id, output, group, embedding)
+
+async def run_workflow(graph, state: Optional[dict], project_id: str) -> dict:
+    """Run a project's workflow, or resume it when state is None"""
+    # Capped to avoid exhausting OpenAI rate limits
+    try:
+        async with workflow_semaphore:
+            return await graph.ainvoke(state, config=workflow_config(project_id))
+    except Exception as e:
+        if not ProjectService.get_project_by_id(project_id):
+            # Deleted mid-run - drop the checkpoints written since the delete
+            await delete_workflow_checkpoints(project_id)
+            raise project_deleted() from e
+        raise WorkflowInterrupted(project_id, e) from e
+
+def workflow_config(project_id: str) -> dict:
+    """Checkpointer config scoping a workflow run to its project"""
+    return {"configurable": {"thread_id": project_id}}
+
+async def delete_workflow_checkpoints(project_id: str):
+    """Remove every checkpoint stored for a project's workflow thread"""
+    # AsyncSqliteSaver has no delete API as of langgraph 0.0.48, so this
+    # writes to its private `checkpoints` table (keyed by thread_id) directly.
+    # Recheck the schema when upgrading langgraph.
+    await checkpointer.setup()
+    async with checkpointer.lock:
+        await checkpointer.conn.execute(
+            "DELETE FROM checkpoints WHERE thread_id = ?", (project_id,)
+        )
+        await checkpointer.conn.commit()
+
+async def complete_run(project_id: str, output: dict, group: str, embedding: list[float]) -> ProjectResponse:
+    """Store and cache a finished run, then drop its checkpoints - only failed runs need them"""
+    try:
+        response = save_project_results(project_id, output)
+        response_cache.put(project_id, group, embedding, response)
+        return response
+    finally:
+        await delete_workflow_checkpoints(project_id)
+
+def project_deleted() -> HTTPException:
+    """Error for a project deleted while its workflow was still running"""
+    return HTTPException(status_code=409, detail="Project was deleted during generation")
+
+def save_project_results(project_id: str, output: dict) -> ProjectResponse:
+    """Store the workflow output on the project and build the response"""
+    # Update project with generated content using service
+    updated_project = ProjectService.update_project_results(
+        project_id,
+        output["plan"],
+        output["schedule"],
+        output["review"],
+        output["html_output"]
+    )
+    if not updated_project:
+        raise project_deleted()
+    
+    return ProjectResponse(
+        id=updated_project.id,
+        plan=output["plan"],
+        schedule=output["schedule"],
+        review=output["review"],
+        html_output=output["html_output"],
+        created_at=updated_project.created_at
+    )
+
+def to_batch_item(result) -> BatchItemResponse:
+    """Map a gathered result or exception to a per-item batch entry"""
+    if isinstance(result, WorkflowInterrupted):
+        return BatchItemResponse(error=str(result.error), project_id=result.project_id)
+    if isinstance(result, HTTPException):
+        return BatchItemResponse(error=str(result.detail))
+    if isinstance(result, BaseException):
+        return BatchItemResponse(error=str(result) or type(result).__name__)
+    return BatchItemResponse(project=result)
+
+def workflow_error(e: Exception) -> HTTPException:
+    """Map an error from a generation route to its HTTP response"""
+    if isinstance(e, HTTPException):
+        return e
+    if isinstance(e, WorkflowInterrupted):
+        return HTTPException(
+            status_code=500,
+            detail={"message": str(e.error), "project_id": e.project_id}
+        )
+    return HTTPException(status_code=500, detail=str(e))
+
+# API Routes
+@app.get("/")
+async def root():
+    return {"message": "Project Management System API with In-Memory Storage"}
+
+@app.post("/generate-project-plan", response_model=ProjectResponse)
+async def generate_project_plan(project_input: ProjectInput):
+    try:
+        return await run_project_generation(project_input)
+    except Exception as e:
+        raise workflow_error(e)
+
+@app.post("/generate-project-plan/stream")
+async def generate_project_plan_stream(project_input: ProjectInput, background_tasks: BackgroundTasks):
+    """Generate a project plan, streaming the HTML page as it is produced"""
+    try:
+        formatted_input = format_project_input(project_input)
         
-        # Run the workflow
-        output = app_workflow.invoke({"input": formatted_input})
+        # Return a stored result for the same or a near-duplicate project
+        group = cache_group(project_input.team_members)
+        embedding = await embeddings.aembed_query(formatted_input)
+        cached = response_cache.get(group, embedding)
+        if cached is not None:
+            return HTMLResponse(cached.html_output, headers={"X-Project-Id": cached.id})
         
-        # Update project with generated content using service
-        updated_project = ProjectService.update_project_results(
-            project.id,
-            output["plan"],
-            output["schedule"],
-            output["review"],
-            output["html_output"]
-        )
+        # Run the planning stage up front and store its results. It goes
+        # through the checkpointed graph, so /projects/{id}/resume can pick
+        # up if planning fails or the stream below is cut off.
+        project = ProjectService.create_project(project_input)
         
-        return ProjectResponse(
-            id=updated_project.id,
-            plan=output["plan"],
-            schedule=output["schedule"],
-            review=output["review"],
-            html_output=output["html_output"],
-            created_at=updated_project.created_at
-        )
+        # Hold the project's in-flight slot until the page is stored, so a
+        # resume sent meanwhile waits for this run instead of repeating it
+        claim_inflight(project.id)
+        try:
+            state = await run_workflow(
+                planning_workflow,
+                {"input": formatted_input},
+                project.id
+            )
+            if not ProjectService.update_project_results(
+                project.id, state["plan"], state["schedule"], state["review"], ""
+            ):
+                await delete_workflow_checkpoints(project.id)
+                raise project_deleted()
+        except BaseException as e:
+            release_inflight(project.id, error=e)
+            raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise workflow_error(e)
+    
+    chunks = []
+    completed = False
+    
+    async def stream():
+        nonlocal completed
+        try:
+            async with workflow_semaphore:
+                async for chunk in html_chain.astream(state):
+                    chunks.append(chunk)
+                    yield chunk
+        except Exception as e:
+            # A failed stream skips save_html, so release the slot here
+            release_inflight(project.id, error=e)
+            raise
+        completed = True
+    
+    async def save_html():
+        # A disconnected or failed stream leaves a partial page - keep it out
+        # of the store and cache, the checkpoint above allows a resume
+        if not completed:
+            release_inflight(project.id, error=RuntimeError("Streamed generation was cut off"))
+            return
+        state["html_output"] = "".join(chunks)
+        try:
+            response = await complete_run(project.id, state, group, embedding)
+        except Exception as e:
+            release_inflight(project.id, error=e)
+            # Deleted while streaming - its checkpoints are already dropped
+            if isinstance(e, HTTPException):
+                return
+            raise
+        release_inflight(project.id, result=response)
+    
+    # Runs once the page has been sent, or once the client disconnects
+    background_tasks.add_task(save_html)
+    return StreamingResponse(
+        stream(), media_type="text/html", headers={"X-Project-Id": project.id}
+    )
+
+@app.post("/generate-project-plans", response_model=List[BatchItemResponse])
+async def generate_batch(inputs: List[ProjectInput]):
+    """Generate plans for several projects concurrently"""
+    if len(inputs) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch exceeds the limit of {MAX_BATCH_SIZE} projects"
+        )
+    
+    # Bound each whole item, not just its workflow run, so the embedding
+    # lookups of a large batch don't all hit OpenAI at once
+    batch_semaphore = asyncio.Semaphore(OPENAI_CONCURRENCY)
+    
+    async def run_item(project_input: ProjectInput) -> ProjectResponse:
+        async with batch_semaphore:
+            return await run_project_generation(project_input)
+    
+    results = await asyncio.gather(
+        *[run_item(project_input) for project_input in inputs],
+        return_exceptions=True
+    )
+    return [to_batch_item(result) for result in results]
 
 @app.get("/projects", response_model=List[ProjectListResponse])
 async def get_projects():
     """Get list of all projects"""
+    global _list_cache
     try:
-        projects = ProjectService.get_all_projects()
-        return [
-            ProjectListResponse(
-                id=project.id,
-                project_type=project.project_type,
-                objectives=project.objectives,
-                industry=project.industry,
-                created_at=project.created_at
-            )
-            for project in projects
-        ]
+        if _list_cache is None or _list_cache[0] != ProjectService.revision:
+            projects = ProjectService.get_all_projects()
+            content = orjson.dumps([
+                {
+                    "id": project.id,
+                    "project_type": project.project_type,
+                    "objectives": project.objectives,
+                    "industry": project.industry,
+                    "created_at": project.created_at
+                }
+                for project in projects
+            ])
+            _list_cache = (ProjectService.revision, content)
+        
+        return Response(content=_list_cache[1], media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -258,13 +560,27 @@ async def get_project(project_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/projects/{project_id}/resume", response_model=ProjectResponse)
+async def resume_project(project_id: str):
+    """Resume a failed generation without re-running completed stages"""
+    try:
+        # Concurrent resumes, or one sent while a streamed run is still
+        # producing its page, share that run instead of repeating it
+        return await share_inflight(project_id, lambda: resume_project_generation(project_id))
+    except Exception as e:
+        raise workflow_error(e)
+
 @app.delete("/projects/{project_id}")
 async def delete_project(project_id: str):
     """Delete a specific project by ID"""
     try:
+        # Checkpoints outlive the in-memory store across restarts, so clear
+        # them even when the project itself is already gone
+        await delete_workflow_checkpoints(project_id)
         if not ProjectService.delete_project(project_id):
             raise HTTPException(status_code=404, detail="Project not found")
         
+        response_cache.discard(project_id)
         return {"message": "Project deleted successfully"}
     except HTTPException:
         raise
@@ -272,10 +588,10 @@ async def delete_project(project_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/projects/search/{query}")
-async def search_projects(query: str):
-    """Search projects by query string"""
+async def search_projects(query: str, industry: Optional[str] = None):
+    """Search projects by query string, optionally within a single industry"""
     try:
-        projects = ProjectService.search_projects(query)
+        projects = ProjectService.search_projects(query, industry)
         return [
             ProjectListResponse(
                 id=project.id,
@@ -0,0 +1,58 @@
+from typing import Sequence
+
+ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+class FastCORS:
+    """Pure-ASGI CORS middleware for a single allowed origin with credentials"""
+
+    def __init__(self, app, origin: str, expose_headers: Sequence[str] = ()):
+        self.app = app
+        self.origin = origin.encode("latin-1")
+        self.cors_headers = [
+            (b"access-control-allow-origin", self.origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        if expose_headers:
+            self.cors_headers.append(
+                (b"access-control-expose-headers", ", ".join(expose_headers).encode("latin-1"))
+            )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # Same-origin and disallowed-origin requests pass through untouched
+        if origin != self.origin:
+            await self.app(scope, receive, send)
+            return
+
+        # Answer preflight requests directly without reaching the app
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = self.cors_headers + [
+                (b"access-control-allow-methods", ALLOW_METHODS),
+                (b"access-control-max-age", b"600"),
+                (b"content-length", b"0"),
+            ]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + self.cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -1,6 +1,8 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
-import uuid
+from ulid import ULID
 from pydantic import BaseModel
 
 # Define models locally to avoid circular imports
@@ -11,30 +13,56 @@ class ProjectInput(BaseModel):
     team_members: list[str]
     requirements: list[str]
 
-class Project(BaseModel):
+# Internal record - a plain dataclass, since it never needs request validation
+@dataclass(slots=True)
+class Project:
     id: str
     project_type: str
     objectives: str
     industry: str
     team_members: List[str]
     requirements: List[str]
+    created_at: datetime
+    updated_at: datetime
     plan: Optional[str] = None
     schedule: Optional[str] = None
     review: Optional[str] = None
     html_output: Optional[str] = None
-    created_at: datetime
-    updated_at: datetime
 
-# In-memory storage - this will be shared across the application
-projects_store = {}
+# In-memory storage - this will be shared across the application.
+# Insertion order is creation order.
+projects_store: Dict[str, Project] = {}
+
+# Search indexes, maintained alongside projects_store. Industry members are
+# kept in a dict rather than a set so they stay in insertion order.
+_search_blob: Dict[str, str] = {}
+_by_industry: Dict[str, Dict[str, None]] = defaultdict(dict)
+
+def _index_project(project: Project):
+    """Precompute lowercased searchable text and industry membership"""
+    _search_blob[project.id] = "\0".join(
+        (project.objectives, project.project_type, project.industry)
+    ).lower()
+    _by_industry[project.industry.lower()][project.id] = None
+
+def _unindex_project(project: Project):
+    """Remove a project from all search indexes"""
+    _search_blob.pop(project.id, None)
+    industry_key = project.industry.lower()
+    _by_industry[industry_key].pop(project.id, None)
+    if not _by_industry[industry_key]:
+        del _by_industry[industry_key]
 
 class ProjectService:
     """Service class for project-related operations using in-memory storage"""
     
+    # Bumped on every write so readers can cache derived views of the store
+    revision: int = 0
+    
     @staticmethod
     def create_project(project_input: ProjectInput) -> Project:
         """Create a new project in memory"""
-        project_id = str(uuid.uuid4())
+        project_id = str(ULID())
         now = datetime.utcnow()
         
         project = Project(
@@ -49,6 +77,8 @@ class ProjectService:
         )
         
         projects_store[project_id] = project
+        _index_project(project)
+        ProjectService.revision += 1
         return project
     
     @staticmethod
@@ -71,11 +101,12 @@ class ProjectService:
         project.updated_at = datetime.utcnow()
         
         projects_store[project_id] = project
+        ProjectService.revision += 1
         return project
     
     @staticmethod
     def get_all_projects() -> List[Project]:
-        """Get all projects from memory"""
+        """Get all projects from memory, oldest first"""
         return list(projects_store.values())
     
     @staticmethod
@@ -87,20 +118,25 @@ class ProjectService:
     def delete_project(project_id: str) -> bool:
         """Delete a project by ID from memory"""
         if project_id in projects_store:
-            del projects_store[project_id]
+            _unindex_project(projects_store.pop(project_id))
+            ProjectService.revision += 1
             return True
         return False
     
     @staticmethod
-    def search_projects(query: str) -> List[Project]:
-        """Search projects by text in objectives, project_type, or industry"""
+    def search_projects(query: str, industry: Optional[str] = None) -> List[Project]:
+        """Search projects by text in objectives, project_type, or industry,
+        restricted to one industry (case-insensitive) when industry is given"""
         query_lower = query.lower()
-        results = []
+        # NUL separates fields in the index, so it would match every project
+        if "\0" in query_lower:
+            return []
         
-        for project in projects_store.values():
-            if (query_lower in project.objectives.lower() or 
-                query_lower in project.project_type.lower() or 
-                query_lower in project.industry.lower()):
-                results.append(project)
+        if industry is not None:
+            # Only the industry's own ids are scanned, in insertion order
+            industry_ids = _by_industry.get(industry.lower(), {})
+            blobs = ((pid, _search_blob[pid]) for pid in industry_ids)
+        else:
+            blobs = _search_blob.items()
         
-        return results
\ No newline at end of file
+        return [projects_store[pid] for pid, blob in blobs if query_lower in blob]